@@ -5,20 +5,55 @@ Extracts historical POI data for critical infrastructure in Houston and Dallas,
 Uses OSMnx to query Overpass API with temporal targeting (2022-06-01).
 
 Output: CSV file with Point coordinates (Lat/Lon) and metadata attributes.
+
+Optional dependencies: orjson (faster Overpass JSON decoding) and numba
+(compiled coordinate checks) are used automatically when installed; h3 >= 4
+(hexagonal dedup grid) is used only when TEXAS_POI_DEDUP_GRID=h3.
 """
 
+import hashlib
+import json
+import multiprocessing
 import os
+import re
+import shutil
 import sys
-import warnings
+from collections import OrderedDict
+from contextlib import contextmanager, suppress
 from datetime import datetime
 
 import osmnx as ox
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pac
+import pyarrow.dataset as ds
+import pyogrio
+import requests
+import shapely
 from shapely.geometry import Point
 
-# Suppress warnings for cleaner output
-warnings.filterwarnings('ignore')
+try:
+    import h3
+except ImportError:
+    h3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba is optional: fall back to running the kernels as plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # =============================================================================
 # CONFIGURATION
@@ -42,9 +77,20 @@ INFRASTRUCTURE_TAGS = {
     "aeroway": ["aerodrome"]
 }
 
-# Output file
+# Optional local OSM extract (e.g. Geofabrik texas-latest.osm.pbf); when set,
+# features are read from it with GDAL instead of querying Overpass
+PBF_PATH = os.getenv("TEXAS_POI_PBF")
+PBF_LAYERS = ("points", "multipolygons")
+
+# GDAL OSM driver config: makes closed power/man_made/telecom ways polygons (the
+# default osmconf.ini leaves them in the unread 'lines' layer) and promotes the
+# target tags to fields
+PBF_CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "osmconf_texas_infra.ini")
+
+# Output file; set TEXAS_POI_GEOJSON to a '.ndjson' name for newline-delimited GeoJSON
 OUTPUT_FILE = "texas_critical_infra_points_2022.csv"
-OUTPUT_GEOJSON = "texas_critical_infra_points_2022.geojson"
+OUTPUT_GEOJSON = os.getenv("TEXAS_POI_GEOJSON", "texas_critical_infra_points_2022.geojson")
+OUTPUT_PARQUET = "texas_critical_infra_points_2022.parquet"
 
 # Texas coordinate bounds for sanity check
 TEXAS_LAT_BOUNDS = (25.8, 36.5)  # Latitude range
@@ -54,6 +100,15 @@ TEXAS_LON_BOUNDS = (-106.6, -93.5)  # Longitude range
 HOUSTON_DALLAS_LAT_BOUNDS = (29.0, 33.5)
 HOUSTON_DALLAS_LON_BOUNDS = (-97.5, -94.5)
 
+# Features of the same category closer than roughly this many meters are
+# treated as duplicates; the grid is 'square' (default) or 'h3'
+DEDUP_GRID_METERS = 25
+DEDUP_GRID = os.getenv("TEXAS_POI_DEDUP_GRID", "square")
+METERS_PER_DEGREE = 111_320
+
+# Planar CRS for centroid math (Texas Centric Albers Equal Area)
+CENTROID_CRS = "EPSG:3083"
+
 # Columns to keep in final output
 KEEP_COLUMNS = [
     'name', 'power', 'amenity', 'man_made', 'telecom', 'aeroway',
@@ -61,25 +116,74 @@ KEEP_COLUMNS = [
     'operator', 'capacity', 'voltage', 'lat', 'lon', 'city_source'
 ]
 
+# Columns retained straight after the fetch; everything else is dropped before any copy
+FETCH_COLUMNS = set(KEEP_COLUMNS) | {'geometry', 'osmid', 'element_type'}
+
+# On-disk cache for immutable historical query results (and OSMnx's HTTP cache)
+CACHE_DIR = os.path.expanduser(os.getenv("TEXAS_INFRA_CACHE", "~/.cache/texas_infra"))
+
+# Overpass allows only a few concurrent slots per IP; with fewer than 2 the
+# current-data fallback is never started speculatively
+OVERPASS_CONCURRENCY = int(os.getenv("OVERPASS_CONCURRENCY", "2"))
+
+# Opt-in: start the current-data fallback alongside the historical query.
+# Off by default since it doubles the Overpass load of every uncached run.
+SPECULATIVE_FALLBACK = os.getenv("TEXAS_POI_SPECULATIVE_FALLBACK", "0") == "1"
+
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
-def configure_osmnx_historical():
-    """Configure OSMnx for historical data extraction."""
-    ox.settings.overpass_settings = f'[out:json][timeout:180][date:"{HISTORICAL_DATE}"]'
-    ox.settings.timeout = 180
-    ox.settings.log_console = False
-    print(f"[CONFIG] Overpass API configured for historical date: {HISTORICAL_DATE}")
+_REQUESTS_JSON = requests.Response.json
 
 
-def configure_osmnx_current():
-    """Configure OSMnx for current data (fallback)."""
-    ox.settings.overpass_settings = '[out:json][timeout:180]'
+def _orjson_response_json(self, **kwargs):
+    """Decode a response body with orjson, deferring to requests on failure."""
+    try:
+        return orjson.loads(self.content)
+    except orjson.JSONDecodeError:
+        return _REQUESTS_JSON(self, **kwargs)
+
+
+def enable_fast_json():
+    """Make OSMnx decode Overpass responses with orjson when it is installed."""
+    if orjson is not None:
+        requests.Response.json = _orjson_response_json
+
+
+def configure_osmnx(verbose=True):
+    """Configure the OSMnx settings shared by historical and current queries."""
     ox.settings.timeout = 180
     ox.settings.log_console = False
-    print("[CONFIG] Overpass API configured for CURRENT data (fallback mode)")
+    ox.settings.use_cache = True
+    ox.settings.cache_folder = os.path.join(CACHE_DIR, "http")
+    enable_fast_json()
+
+    if verbose:
+        print(f"[CONFIG] OSMnx configured (cache: {ox.settings.cache_folder})")
+        if orjson is not None:
+            print("[CONFIG] Using orjson to decode Overpass responses")
+
+
+@contextmanager
+def _overpass_settings(date=None):
+    """
+    Temporarily set the Overpass query header, pinned to `date` if given.
+
+    OSMnx reads this header from its process-global settings, so queries with
+    different headers must not overlap within one process.
+    """
+    previous = ox.settings.overpass_settings
+    if date:
+        ox.settings.overpass_settings = f'[out:json][timeout:180][date:"{date}"]'
+    else:
+        ox.settings.overpass_settings = '[out:json][timeout:180]'
+
+    try:
+        yield
+    finally:
+        ox.settings.overpass_settings = previous
 
 
 def build_tags_dict():
@@ -93,27 +197,153 @@ def build_tags_dict():
     return tags
 
 
-def fetch_infrastructure_data(location, tags, use_historical=True):
+def _cache_key(locations, tags, date):
+    """Stable hash of the query parameters, used as the cache file name."""
+    payload = json.dumps({
+        "locations": list(locations),
+        "tags": sorted((key, sorted(values)) for key, values in tags.items()),
+        "date": date,
+    })
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def _historical_cache_path(tags):
+    """Cache file for the historical snapshot of LOCATIONS with these tags."""
+    return os.path.join(CACHE_DIR, _cache_key(LOCATIONS, tags, HISTORICAL_DATE) + ".parquet")
+
+
+def get_city_boundaries():
+    """
+    Geocode the boundary polygon of every location in LOCATIONS.
+
+    Returns:
+        GeoDataFrame with 'city_source' and 'geometry' columns, or None if failed
+    """
+    try:
+        boundaries = ox.geocode_to_gdf(LOCATIONS)
+    except Exception as e:
+        print(f"[ERROR] Failed to geocode locations: {str(e)}")
+        return None
+
+    # geocode_to_gdf returns rows in query order
+    boundaries['city_source'] = [location.split(",")[0] for location in LOCATIONS]
+    return boundaries[['city_source', 'geometry']]
+
+
+def _get_union_polygon(boundaries):
+    """
+    Dissolve the city boundaries into a single polygon for the final spatial filter.
+
+    Not for building the query itself: OSMnx replaces a MultiPolygon by its
+    convex hull before subdividing it, which for Houston + Dallas covers the
+    whole corridor between the cities.
+    """
+    return shapely.union_all(boundaries.geometry.values)
+
+
+def _combined_tag_filter(tags):
+    """Single Overpass QL regex filter matching any requested key with any requested value."""
+    keys = "|".join(sorted(tags))
+    values = "|".join(sorted({value for values in tags.values() for value in values}))
+    return f'[~"^({keys})$"~"^({values})$"]'
+
+
+def _features_from_polygon_combined(boundaries, tags):
+    """
+    Query features within the city boundaries with one regex tag clause instead of one per tag.
+
+    OSMnx emits a separate union clause per (key, value) pair, so Overpass scans
+    its tag index once per pair. This builds the query body itself, with one
+    poly clause per city sub-polygon inside a single union so all cities go out
+    in one request, and reuses OSMnx's private request/parse helpers; their tag
+    filtering drops any cross-product matches the regex lets through
+    (e.g. power=hospital).
+
+    Raises:
+        ImportError, AttributeError or TypeError if the private OSMnx API changed
+    """
+    import osmnx._overpass as overpass
+
+    settings_str = overpass._make_overpass_settings()
+    tag_filter = _combined_tag_filter(tags)
+
+    # Subdivide each city on its own so the query never covers the land between them
+    poly_clauses = "".join(
+        f'nwr{tag_filter}(poly:"{polygon_coord_str}");'
+        for geometry in boundaries.geometry
+        for polygon_coord_str in overpass._make_overpass_polygon_coord_strs(geometry)
+    )
+    query = f'{settings_str};({poly_clauses}>;);out;'
+    response_json = overpass._overpass_request(OrderedDict(data=query))
+
+    return ox.features._create_gdf([response_json], _get_union_polygon(boundaries), tags)
+
+
+def fetch_infrastructure_data(boundaries, tags, use_historical=True):
     """
-    Fetch infrastructure data from OSM for a given location.
+    Fetch infrastructure data from OSM for all city boundaries in one query.
 
     Args:
-        location: Place name string
+        boundaries: GeoDataFrame of city boundaries (see get_city_boundaries)
         tags: Dictionary of OSM tags to query
         use_historical: Whether to use historical date setting
 
     Returns:
         GeoDataFrame with fetched features, or None if failed
     """
+    location = " + ".join(boundaries['city_source'])
+
+    # A fixed historical snapshot never changes, so its result can be reused
+    cache_path = None
+    if use_historical:
+        cache_path = _historical_cache_path(tags)
+        if os.path.exists(cache_path):
+            try:
+                gdf = gpd.read_parquet(cache_path)
+                print(f"[CACHE] Loaded {len(gdf)} features for {location} from {cache_path}")
+                return gdf
+            except Exception as e:
+                # Unreadable cache file: treat as a miss and fetch again
+                print(f"[WARN] Discarding unreadable cache file {cache_path}: {str(e)}")
+                # Another run may have removed or replaced it already
+                with suppress(OSError):
+                    os.remove(cache_path)
+
     try:
         print(f"[FETCH] Querying {location}...")
-        gdf = ox.features_from_place(location, tags=tags)
+        with _overpass_settings(HISTORICAL_DATE if use_historical else None):
+            try:
+                gdf = _features_from_polygon_combined(boundaries, tags)
+            except (ImportError, AttributeError, TypeError) as e:
+                print(f"[WARN] Combined tag query unavailable ({str(e)}); using features_from_polygon")
+                # One call per city: passing the union would query its convex hull
+                gdf = pd.concat([ox.features_from_polygon(geometry, tags=tags)
+                                 for geometry in boundaries.geometry])
+                gdf = gdf[~gdf.index.duplicated(keep='first')]
 
         if gdf is None or len(gdf) == 0:
             print(f"[WARN] No data returned for {location}")
             return None
 
         print(f"[FETCH] Retrieved {len(gdf)} features from {location}")
+
+        # Drop the long tail of unused OSM tag columns as early as possible
+        gdf = gdf[[col for col in gdf.columns if col in FETCH_COLUMNS]]
+
+        if cache_path is not None:
+            # Write to a temp file and move it into place, so an interrupted
+            # run never leaves a truncated cache file behind
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                gdf.to_parquet(tmp_path)
+                os.replace(tmp_path, cache_path)
+                print(f"[CACHE] Saved query result to: {cache_path}")
+            except Exception as e:
+                print(f"[WARN] Could not cache query result: {str(e)}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
         return gdf
 
     except Exception as e:
@@ -125,6 +355,9 @@ def convert_to_centroids(gdf):
     """
     Convert all geometries to Point centroids.
 
+    The geometry/lon/lat columns are set in place: callers pass the frame the
+    fetch step just built and do not reuse it.
+
     Args:
         gdf: GeoDataFrame with mixed geometries
 
@@ -138,24 +371,142 @@ def convert_to_centroids(gdf):
     if gdf.crs is None:
         gdf = gdf.set_crs("EPSG:4326")
 
-    # Convert to centroids
-    gdf = gdf.copy()
-    gdf['geometry'] = gdf['geometry'].centroid
+    geoms = np.asarray(gdf.geometry.values)
+
+    # Points are their own centroid: copy their coordinates directly and only
+    # send polygons/lines through the GEOS centroid algorithm
+    is_point = shapely.get_type_id(geoms) == 0
+    coords = np.empty((len(geoms), 2))
+    coords[is_point] = shapely.get_coordinates(geoms[is_point])
 
-    # Extract lat/lon from centroid points
-    gdf['lon'] = gdf['geometry'].x
-    gdf['lat'] = gdf['geometry'].y
+    if (~is_point).any():
+        # Centroids are planar math, so compute them in a projected CRS
+        projected = gpd.GeoSeries(geoms[~is_point], crs=gdf.crs).to_crs(CENTROID_CRS)
+        centroids = gpd.GeoSeries(
+            shapely.centroid(projected.values), crs=CENTROID_CRS
+        ).to_crs(gdf.crs)
+        coords[~is_point] = shapely.get_coordinates(centroids.values)
+
+    # Replace only the three changed columns, without copying the frame
+    gdf['lon'] = coords[:, 0]
+    gdf['lat'] = coords[:, 1]
+    gdf['geometry'] = gpd.points_from_xy(coords[:, 0], coords[:, 1], crs=gdf.crs)
 
     return gdf
 
 
-def clean_and_filter(gdf, city_name):
+def _pbf_where(fields, tags):
+    """
+    Build an OGR SQL filter for one PBF layer from the requested tags.
+
+    Keys that GDAL's osmconf.ini does not promote to their own field are
+    matched inside the 'other_tags' HSTORE string.
+    """
+    clauses = []
+    for key, values in tags.items():
+        if key in fields:
+            quoted = ", ".join(f"'{value}'" for value in values)
+            clauses.append(f'"{key}" IN ({quoted})')
+        elif 'other_tags' in fields:
+            clauses.extend(f"other_tags LIKE '%\"{key}\"=>\"{value}\"%'" for value in values)
+    return " OR ".join(clauses)
+
+
+def fetch_from_pbf(pbf_path, bbox, tags, where=None):
+    """
+    Read infrastructure features from a local .osm.pbf extract with pyogrio.
+
+    The result mirrors OSMnx's output (element_type/osmid index, one column per
+    tag) so the rest of the pipeline is unchanged.
+
+    Args:
+        pbf_path: Path to the .osm.pbf file
+        bbox: (lon_min, lat_min, lon_max, lat_max) spatial filter
+        tags: Dictionary of OSM tags to read
+        where: OGR SQL filter for every layer; built per layer from tags if None
+
+    Returns:
+        GeoDataFrame with fetched features, or None if failed
+    """
+    tag_keys = [col for col in KEEP_COLUMNS if col not in ('lat', 'lon', 'city_source')]
+    layers = []
+
+    try:
+        pyogrio.set_gdal_config_options({"OSM_CONFIG_FILE": PBF_CONFIG_FILE})
+
+        for layer in PBF_LAYERS:
+            fields = list(pyogrio.read_info(pbf_path, layer=layer)['fields'])
+            layer_where = where if where is not None else _pbf_where(fields, tags)
+
+            print(f"[FETCH] Reading '{layer}' layer from {pbf_path}...")
+            gdf = pyogrio.read_dataframe(pbf_path, layer=layer, bbox=bbox, where=layer_where)
+
+            if len(gdf) == 0:
+                continue
+
+            # Pull any tags still left in the HSTORE string into their own columns
+            for key in tag_keys:
+                if key not in gdf.columns and 'other_tags' in gdf.columns:
+                    gdf[key] = gdf['other_tags'].str.extract(f'"{re.escape(key)}"=>"([^"]*)"', expand=False)
+
+            # Multipolygons come from closed ways (osm_way_id) or relations (osm_id)
+            if 'osm_way_id' in gdf.columns:
+                is_way = gdf['osm_way_id'].notna().to_numpy()
+                gdf['element_type'] = np.where(is_way, 'way', 'relation')
+                gdf['osmid'] = gdf['osm_way_id'].where(is_way, gdf['osm_id'])
+            else:
+                gdf['element_type'] = 'node'
+                gdf['osmid'] = gdf['osm_id']
+            gdf['osmid'] = pd.to_numeric(gdf['osmid']).astype(np.int64)
+
+            layers.append(gdf.set_index(['element_type', 'osmid']))
+
+    except Exception as e:
+        print(f"[ERROR] Failed to read {pbf_path}: {str(e)}")
+        return None
+
+    if not layers:
+        print(f"[WARN] No data found in {pbf_path}")
+        return None
+
+    gdf = pd.concat(layers).set_crs("EPSG:4326", allow_override=True)
+    gdf = gdf[[col for col in gdf.columns if col in FETCH_COLUMNS]]
+
+    print(f"[FETCH] Retrieved {len(gdf)} features from {pbf_path}")
+    return gdf
+
+
+def assign_city_source(gdf, boundaries):
+    """
+    Tag each centroid with the city whose boundary contains it.
+
+    Args:
+        gdf: GeoDataFrame with Point centroids
+        boundaries: GeoDataFrame of city boundaries (see get_city_boundaries)
+
+    Returns:
+        GeoDataFrame with a 'city_source' column; points outside every boundary are dropped
+    """
+    if gdf is None or len(gdf) == 0:
+        return None
+
+    joined = gpd.sjoin(
+        gdf,
+        boundaries.to_crs(gdf.crs),
+        how='inner',
+        predicate='within'
+    ).drop(columns='index_right')
+
+    print(f"[JOIN] {len(joined)} of {len(gdf)} features fall within city boundaries")
+    return joined
+
+
+def clean_and_filter(gdf):
     """
     Clean attributes and filter out rows without meaningful tags.
 
     Args:
-        gdf: GeoDataFrame to clean
-        city_name: Source city name for tracking
+        gdf: GeoDataFrame to clean (with 'city_source' assigned)
 
     Returns:
         Cleaned GeoDataFrame
@@ -163,14 +514,23 @@ def clean_and_filter(gdf, city_name):
     if gdf is None or len(gdf) == 0:
         return None
 
-    gdf = gdf.copy()
-
-    # Add source city
-    gdf['city_source'] = city_name
+    # Project to the output columns first so every later step works on a narrow frame
+    gdf = gdf[[col for col in KEEP_COLUMNS if col in gdf.columns]]
 
     # Reset index to get osmid as a column
     gdf = gdf.reset_index()
 
+    # Store tag/text columns as Arrow strings instead of one Python object per cell
+    str_cols = [col for col in gdf.columns if col not in ('geometry', 'lat', 'lon', 'osmid')]
+    gdf[str_cols] = gdf[str_cols].astype('string[pyarrow]')
+
+    # Select and reorder columns, with osmid/element_type first if available
+    available_cols = [col for col in KEEP_COLUMNS if col in gdf.columns]
+    if 'osmid' in gdf.columns:
+        available_cols = ['osmid'] + available_cols
+    if 'element_type' in gdf.columns:
+        available_cols = ['element_type'] + available_cols
+
     # Define the infrastructure tag columns
     tag_columns = ['power', 'amenity', 'man_made', 'telecom', 'aeroway']
 
@@ -178,23 +538,164 @@ def clean_and_filter(gdf, city_name):
     existing_tag_cols = [col for col in tag_columns if col in gdf.columns]
 
     if existing_tag_cols:
-        # Create mask for rows with at least one valid tag
-        mask = gdf[existing_tag_cols].notna().any(axis=1)
-        gdf = gdf[mask]
+        # Create mask for rows with at least one valid tag (notna reads the Arrow validity bitmaps)
+        mask = gdf[existing_tag_cols].notna().to_numpy().any(axis=1)
+        gdf = gdf.loc[mask, available_cols]
+    else:
+        gdf = gdf[available_cols]
 
-    # Select and reorder columns
-    available_cols = [col for col in KEEP_COLUMNS if col in gdf.columns]
+    for city_name, count in gdf['city_source'].value_counts(sort=False).items():
+        print(f"[CLEAN] {city_name}: {count} records after filtering")
+    return gdf
 
-    # Add osmid if available
-    if 'osmid' in gdf.columns:
-        available_cols = ['osmid'] + available_cols
-    if 'element_type' in gdf.columns:
-        available_cols = ['element_type'] + available_cols
 
-    gdf = gdf[available_cols]
+def _fetch_clean(boundaries, tags, historical, pbf_path=None):
+    """
+    Fetch, centroid, city-tag and clean the features for all LOCATIONS.
 
-    print(f"[CLEAN] {city_name}: {len(gdf)} records after filtering")
-    return gdf
+    Args:
+        boundaries: GeoDataFrame of city boundaries (see get_city_boundaries)
+        tags: Dictionary of OSM tags to query
+        historical: Whether the historical date setting is active
+        pbf_path: Read from this local .osm.pbf instead of Overpass if given
+
+    Returns:
+        Cleaned GeoDataFrame, or None if nothing usable was fetched
+    """
+    if pbf_path:
+        gdf = fetch_from_pbf(pbf_path, tuple(boundaries.total_bounds), tags)
+    else:
+        gdf = fetch_infrastructure_data(boundaries, tags, use_historical=historical)
+
+    if gdf is None:
+        return None
+
+    # Convert to centroids
+    gdf = convert_to_centroids(gdf)
+
+    # Derive source city from the boundaries, then clean and filter
+    gdf = assign_city_source(gdf, boundaries)
+    return clean_and_filter(gdf)
+
+
+def _coord_key(lat, lon, meters=DEDUP_GRID_METERS):
+    """
+    Pack lat/lon grid cell indices into a single uint64 key per row.
+
+    Args:
+        lat: Latitude array (degrees)
+        lon: Longitude array (degrees)
+        meters: Grid cell size in meters
+
+    Returns:
+        np.ndarray of uint64 keys, equal for coordinates in the same grid cell
+    """
+    # Longitude cells are widened by the cosine of the study area's mid-latitude
+    lat_step = meters / METERS_PER_DEGREE
+    lon_step = lat_step / np.cos(np.radians(np.mean(HOUSTON_DALLAS_LAT_BOUNDS)))
+
+    low32 = np.uint64(0xFFFFFFFF)
+    lat_q = np.floor(lat / lat_step).astype(np.int64).view(np.uint64)
+    lon_q = np.floor(lon / lon_step).astype(np.int64).view(np.uint64)
+    return ((lat_q & low32) << np.uint64(32)) | (lon_q & low32)
+
+
+def _h3_resolution(meters):
+    """Finest H3 resolution whose average hexagon edge is at least `meters`."""
+    for res in range(15, -1, -1):
+        if h3.average_hexagon_edge_length(res, unit='m') >= meters:
+            return res
+    return 0
+
+
+def _grid_dedup(df, meters=DEDUP_GRID_METERS, grid=DEDUP_GRID):
+    """
+    Drop features of the same category that share a grid cell, keeping the first.
+
+    This merges the same facility mapped twice (e.g. a hospital node and its
+    building polygon) while distinct facilities, such as neighbouring
+    generators with different tags, are kept apart by their category values.
+
+    Args:
+        df: DataFrame with 'lat'/'lon' and infrastructure tag columns
+        meters: Approximate grid cell size in meters
+        grid: 'square' for the packed lat/lon grid, 'h3' for H3 cells (h3 >= 4,
+            computed per row)
+
+    Returns:
+        Deduplicated DataFrame
+    """
+    lat = df['lat'].to_numpy()
+    lon = df['lon'].to_numpy()
+
+    if grid == 'h3' and h3 is not None and hasattr(h3, 'latlng_to_cell'):
+        res = _h3_resolution(meters)
+        cells = [h3.latlng_to_cell(la, lo, res) for la, lo in zip(lat, lon)]
+    else:
+        if grid == 'h3':
+            print("[WARN] h3 >= 4 not available; using the square dedup grid")
+        cells = _coord_key(lat, lon, meters)
+
+    # Fold the category values and the cell into one uint64 per row, so the
+    # duplicate check hashes a single column instead of a multi-column frame
+    category_cols = [col for col in INFRASTRUCTURE_TAGS if col in df.columns]
+    keys = pd.util.hash_pandas_object(df[category_cols].assign(_cell=cells), index=False)
+
+    return df[~keys.duplicated(keep='first').to_numpy()]
+
+
+@njit(parallel=True, cache=True)
+def _in_bbox(lat, lon, lat_lo, lat_hi, lon_lo, lon_hi):
+    """
+    Per-row bounding-box test compiled to a parallel SIMD loop.
+
+    No fastmath here: NaN coordinates must compare False.
+
+    Returns:
+        Boolean array, True where (lat, lon) lies inside the box
+    """
+    out = np.empty(lat.size, np.bool_)
+    for i in prange(lat.size):
+        out[i] = (lat[i] >= lat_lo) & (lat[i] <= lat_hi) & (lon[i] >= lon_lo) & (lon[i] <= lon_hi)
+    return out
+
+
+@njit(cache=True)
+def _coord_stats(lat, lon):
+    """
+    Single-pass NaN-skipping count, mean and extent of the lat/lon arrays.
+
+    No fastmath here: the NaN self-comparisons must not be optimized away.
+
+    Returns:
+        Tuple of (lat_valid, lon_valid, mean_lat, mean_lon, lat_min, lat_max, lon_min, lon_max)
+    """
+    lat_valid = 0
+    lon_valid = 0
+    lat_sum = 0.0
+    lon_sum = 0.0
+    lat_min = np.inf
+    lat_max = -np.inf
+    lon_min = np.inf
+    lon_max = -np.inf
+
+    for i in range(lat.size):
+        la = lat[i]
+        lo = lon[i]
+        if la == la:
+            lat_valid += 1
+            lat_sum += la
+            lat_min = min(lat_min, la)
+            lat_max = max(lat_max, la)
+        if lo == lo:
+            lon_valid += 1
+            lon_sum += lo
+            lon_min = min(lon_min, lo)
+            lon_max = max(lon_max, lo)
+
+    mean_lat = lat_sum / lat_valid if lat_valid > 0 else np.nan
+    mean_lon = lon_sum / lon_valid if lon_valid > 0 else np.nan
+    return lat_valid, lon_valid, mean_lat, mean_lon, lat_min, lat_max, lon_min, lon_max
 
 
 def verify_data(df):
@@ -230,11 +731,16 @@ def verify_data(df):
         report["errors"].append(f"Volume check failed: only {len(df)} records")
         print(f"[CHECK 1] FAIL: Volume check - only {len(df)} records")
 
-    # Check 2: Coordinate columns exist and contain valid floats
-    if 'lat' in df.columns and 'lon' in df.columns:
-        lat_valid = df['lat'].notna().sum()
-        lon_valid = df['lon'].notna().sum()
+    has_coords = 'lat' in df.columns and 'lon' in df.columns
+
+    if has_coords:
+        # One pass over the coordinate arrays feeds checks 2 and 3
+        lat_valid, lon_valid, mean_lat, mean_lon, lat_min, lat_max, lon_min, lon_max = _coord_stats(
+            df['lat'].to_numpy(dtype=np.float64), df['lon'].to_numpy(dtype=np.float64)
+        )
 
+    # Check 2: Coordinate columns exist and contain valid floats
+    if has_coords:
         if lat_valid > 0 and lon_valid > 0:
             report["check_coordinates"] = True
             print(f"[CHECK 2] PASS: Coordinate check - {lat_valid} valid lat, {lon_valid} valid lon")
@@ -246,16 +752,23 @@ def verify_data(df):
         print("[CHECK 2] FAIL: lat/lon columns missing")
 
     # Check 3: Location sanity check (coordinates within Texas)
-    if 'lat' in df.columns and 'lon' in df.columns:
-        mean_lat = df['lat'].mean()
-        mean_lon = df['lon'].mean()
-
+    if has_coords:
         lat_ok = HOUSTON_DALLAS_LAT_BOUNDS[0] <= mean_lat <= HOUSTON_DALLAS_LAT_BOUNDS[1]
         lon_ok = HOUSTON_DALLAS_LON_BOUNDS[0] <= mean_lon <= HOUSTON_DALLAS_LON_BOUNDS[1]
 
-        if lat_ok and lon_ok:
+        # Every individual point must also fall within Texas, i.e. the whole extent
+        extent_ok = (
+            TEXAS_LAT_BOUNDS[0] <= lat_min and lat_max <= TEXAS_LAT_BOUNDS[1]
+            and TEXAS_LON_BOUNDS[0] <= lon_min and lon_max <= TEXAS_LON_BOUNDS[1]
+        )
+        extent = f"lat [{lat_min:.4f}, {lat_max:.4f}], lon [{lon_min:.4f}, {lon_max:.4f}]"
+
+        if lat_ok and lon_ok and extent_ok:
             report["check_location_sanity"] = True
             print(f"[CHECK 3] PASS: Location sanity - Mean coords ({mean_lat:.4f}, {mean_lon:.4f}) within Texas bounds")
+        elif not extent_ok:
+            report["errors"].append(f"Coordinate extent {extent} outside Texas bounds")
+            print(f"[CHECK 3] FAIL: Coordinate extent {extent} outside Texas bounds")
         else:
             report["errors"].append(f"Mean coords ({mean_lat:.4f}, {mean_lon:.4f}) outside expected bounds")
             print(f"[CHECK 3] FAIL: Mean coords ({mean_lat:.4f}, {mean_lon:.4f}) outside expected bounds")
@@ -266,16 +779,46 @@ def verify_data(df):
     return success, report
 
 
+def save_ndgeojson(df, path):
+    """
+    Save DataFrame as newline-delimited GeoJSON (one Point Feature per line).
+
+    Geometry and properties are pre-serialized column-wise, so no full
+    FeatureCollection is ever built in memory.
+
+    Args:
+        df: DataFrame with 'lat'/'lon' columns
+        path: Output file path
+    """
+    geometries = (
+        '{"type":"Point","coordinates":['
+        + df['lon'].astype(str) + ',' + df['lat'].astype(str)
+        + ']}'
+    )
+    properties = df.drop(columns=['lat', 'lon']).to_json(orient='records', lines=True).splitlines()
+
+    with open(path, 'w', encoding='utf-8') as f:
+        for geometry, props in zip(geometries, properties):
+            f.write('{"type":"Feature","geometry":' + geometry + ',"properties":' + props + '}\n')
+
+
 def save_output(df, csv_path, geojson_path=None):
     """
     Save DataFrame to CSV and optionally GeoJSON.
 
+    A geojson_path ending in '.ndjson' is written as newline-delimited GeoJSON.
+
     Returns:
         bool: Success status
     """
     try:
-        # Save CSV
-        df.to_csv(csv_path, index=False, encoding='utf-8')
+        # Save CSV. Arrow has no minimal quoting: 'needed' quotes every string
+        # value and the header, unlike pandas; numbers stay unquoted
+        pac.write_csv(
+            pa.Table.from_pandas(df, preserve_index=False),
+            csv_path,
+            write_options=pac.WriteOptions(quoting_style='needed')
+        )
         print(f"[SAVE] CSV saved to: {csv_path}")
 
         # Verify file exists
@@ -285,12 +828,15 @@ def save_output(df, csv_path, geojson_path=None):
 
             # Optionally save GeoJSON
             if geojson_path and 'lat' in df.columns and 'lon' in df.columns:
-                gdf = gpd.GeoDataFrame(
-                    df,
-                    geometry=gpd.points_from_xy(df['lon'], df['lat']),
-                    crs="EPSG:4326"
-                )
-                gdf.to_file(geojson_path, driver='GeoJSON')
+                if geojson_path.endswith('.ndjson'):
+                    save_ndgeojson(df, geojson_path)
+                else:
+                    gdf = gpd.GeoDataFrame(
+                        df,
+                        geometry=gpd.points_from_xy(df['lon'], df['lat']),
+                        crs="EPSG:4326"
+                    )
+                    pyogrio.write_dataframe(gdf, geojson_path, driver='GeoJSON')
                 print(f"[SAVE] GeoJSON saved to: {geojson_path}")
 
             return True
@@ -303,10 +849,111 @@ def save_output(df, csv_path, geojson_path=None):
         return False
 
 
+def save_partitioned_parquet(df, parquet_path):
+    """
+    Save DataFrame as a zstd-compressed Parquet dataset partitioned by city_source.
+
+    Returns:
+        bool: Success status
+    """
+    # Write the whole dataset to a temp directory and swap it in, so partitions
+    # of cities missing from this run do not survive from an older one
+    tmp_path = f"{parquet_path}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(
+            tmp_path,
+            engine='pyarrow',
+            partition_cols=['city_source'],
+            compression='zstd',
+            index=False
+        )
+        if os.path.exists(parquet_path):
+            shutil.rmtree(parquet_path)
+        os.replace(tmp_path, parquet_path)
+
+        total_size = sum(
+            os.path.getsize(os.path.join(root, name))
+            for root, _, files in os.walk(parquet_path)
+            for name in files
+        )
+        print(f"[SAVE] Parquet dataset saved to: {parquet_path} ({total_size:,} bytes)")
+
+        dataset = ds.dataset(parquet_path, format='parquet', partitioning='hive')
+        for city_name in sorted(df['city_source'].unique()):
+            count = dataset.count_rows(filter=ds.field('city_source') == city_name)
+            print(f"[SAVE]   city_source={city_name}: {count} records")
+
+        return True
+
+    except Exception as e:
+        print(f"[ERROR] Failed to save Parquet dataset: {str(e)}")
+        if os.path.exists(tmp_path):
+            shutil.rmtree(tmp_path)
+        return False
+
+
 # =============================================================================
 # MAIN EXECUTION
 # =============================================================================
 
+def _fallback_if_sparse(final_df, data_source, fetch_current):
+    """Swap in current data when the historical query returned too little."""
+    total_historical = len(final_df) if final_df is not None else 0
+
+    if total_historical < 50:
+        print()
+        print("[FALLBACK] Historical query returned limited data. Using current data...")
+        print()
+
+        data_source = "Current (fallback)"
+        final_df = fetch_current()
+
+    return final_df, data_source
+
+
+def fetch_from_overpass(boundaries, tags):
+    """
+    Fetch from Overpass, preferring the historical snapshot over current data.
+
+    Args:
+        boundaries: GeoDataFrame of city boundaries (see get_city_boundaries)
+        tags: Dictionary of OSM tags to query
+
+    Returns:
+        Tuple of (cleaned GeoDataFrame or None, data source description)
+    """
+    print(f"[CONFIG] Overpass API configured for historical date: {HISTORICAL_DATE}")
+    print()
+
+    data_source = "Historical (2022-06-01)"
+    speculate = (
+        SPECULATIVE_FALLBACK
+        and OVERPASS_CONCURRENCY >= 2
+        and not os.path.exists(_historical_cache_path(tags))
+    )
+
+    if not speculate:
+        final_df = _fetch_clean(boundaries, tags, historical=True)
+        return _fallback_if_sparse(final_df, data_source,
+                                   lambda: _fetch_clean(boundaries, tags, historical=False))
+
+    # Each query runs in its own process since OSMnx's Overpass header is
+    # global; boundaries were geocoded once in the parent, so only the two
+    # Overpass requests overlap
+    print("[CONFIG] Starting the current-data fallback speculatively")
+    pool = multiprocessing.get_context().Pool(2, initializer=configure_osmnx, initargs=(False,))
+    try:
+        historical_result = pool.apply_async(_fetch_clean, (boundaries, tags, True))
+        current_result = pool.apply_async(_fetch_clean, (boundaries, tags, False))
+        final_df = historical_result.get()
+        return _fallback_if_sparse(final_df, data_source, current_result.get)
+    finally:
+        # terminate() also stops a query still in flight, e.g. the unneeded
+        # current-data one, so it cannot hold up interpreter exit
+        pool.terminate()
+        pool.join()
+
+
 def main():
     """Main execution function."""
     print("=" * 70)
@@ -320,56 +967,28 @@ def main():
     print(f"[INFO] Target tags: {list(tags.keys())}")
     print()
 
-    # Attempt historical data extraction first
-    use_historical = True
-    all_data = []
+    configure_osmnx()
 
-    # Configure for historical query
-    configure_osmnx_historical()
-    print()
-
-    for location in LOCATIONS:
-        gdf = fetch_infrastructure_data(location, tags, use_historical=True)
-
-        if gdf is not None:
-            # Convert to centroids
-            gdf = convert_to_centroids(gdf)
-
-            # Clean and filter
-            city_name = location.split(",")[0]
-            gdf = clean_and_filter(gdf, city_name)
+    # Geocode the city boundaries once; every fetch path reuses them
+    boundaries = get_city_boundaries()
 
-            if gdf is not None and len(gdf) > 0:
-                all_data.append(gdf)
-
-    # If historical query returned too little data, try current data as fallback
-    total_historical = sum(len(d) for d in all_data) if all_data else 0
-
-    if total_historical < 50:
+    if boundaries is None:
+        final_df = None
+    elif PBF_PATH:
+        # Local extract: no Overpass queries, so no historical/current fallback either
+        print(f"[CONFIG] Reading features from local PBF: {PBF_PATH}")
         print()
-        print("[FALLBACK] Historical query returned limited data. Trying current data...")
-        configure_osmnx_current()
-        print()
-
-        all_data = []  # Reset
-        use_historical = False
-
-        for location in LOCATIONS:
-            gdf = fetch_infrastructure_data(location, tags, use_historical=False)
-
-            if gdf is not None:
-                gdf = convert_to_centroids(gdf)
-                city_name = location.split(",")[0]
-                gdf = clean_and_filter(gdf, city_name)
 
-                if gdf is not None and len(gdf) > 0:
-                    all_data.append(gdf)
+        final_df = _fetch_clean(boundaries, tags, historical=False, pbf_path=PBF_PATH)
+        data_source = f"Local PBF ({os.path.basename(PBF_PATH)})"
+    else:
+        final_df, data_source = fetch_from_overpass(boundaries, tags)
 
     # Consolidate all data
     print()
     print("-" * 70)
 
-    if not all_data:
+    if final_df is None or len(final_df) == 0:
         print("[FAILURE REPORT]")
         print("No data could be extracted from any location.")
         print("Possible causes:")
@@ -378,14 +997,20 @@ def main():
         print("  - Invalid location names")
         return False
 
-    # Merge all datasets
-    final_df = pd.concat(all_data, ignore_index=True)
     print(f"[MERGE] Combined dataset: {len(final_df)} total records")
 
-    # Remove duplicates based on coordinates
+    # Drop features whose centroid falls outside Texas
+    in_texas = _in_bbox(
+        final_df['lat'].to_numpy(), final_df['lon'].to_numpy(),
+        *TEXAS_LAT_BOUNDS, *TEXAS_LON_BOUNDS
+    )
+    final_df = final_df[in_texas]
+    print(f"[FILTER] Removed {len(in_texas) - len(final_df)} records outside Texas bounds")
+
+    # Remove duplicates that share a dedup grid cell
     before_dedup = len(final_df)
-    final_df = final_df.drop_duplicates(subset=['lat', 'lon'], keep='first')
-    print(f"[DEDUP] Removed {before_dedup - len(final_df)} duplicate coordinates")
+    final_df = _grid_dedup(final_df)
+    print(f"[DEDUP] Removed {before_dedup - len(final_df)} duplicates within {DEDUP_GRID_METERS} m")
     print(f"[FINAL] Unique records: {len(final_df)}")
     print()
 
@@ -400,12 +1025,19 @@ def main():
     print()
     output_csv = os.path.join(os.getcwd(), OUTPUT_FILE)
     output_geojson = os.path.join(os.getcwd(), OUTPUT_GEOJSON)
+    output_parquet = os.path.join(os.getcwd(), OUTPUT_PARQUET)
 
     file_saved = save_output(final_df, output_csv, output_geojson)
     report["check_file"] = file_saved
 
     if file_saved:
         print(f"[CHECK 4] PASS: File creation verified")
+
+        # The Parquet dataset is a best-effort extra: a failure is recorded
+        # but does not fail the run, since the CSV/GeoJSON outputs exist
+        if not save_partitioned_parquet(final_df, output_parquet):
+            print("[WARN] Parquet dataset not written; CSV/GeoJSON outputs are unaffected")
+            report["errors"].append("Parquet dataset creation failed")
     else:
         print(f"[CHECK 4] FAIL: File creation failed")
         report["errors"].append("File creation failed")
@@ -419,9 +1051,10 @@ def main():
     if overall_success:
         print("SUCCESS: Data extracted successfully!")
         print(f"  Total Records: {len(final_df)}")
-        print(f"  Data Source: {'Historical (2022-06-01)' if use_historical else 'Current (fallback)'}")
+        print(f"  Data Source: {data_source}")
         print(f"  CSV File: {OUTPUT_FILE}")
         print(f"  GeoJSON File: {OUTPUT_GEOJSON}")
+        print(f"  Parquet Dataset: {OUTPUT_PARQUET}")
 
         # Print summary by category
         print()